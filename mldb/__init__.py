@@ -1,7 +1,10 @@
+from mldb.backends import BloscBackend
 from mldb.backends import FileSystemBase
 from mldb.backends import JoblibBackend
 from mldb.backends import JsonBackend
 from mldb.backends import MatPlotLibBackend
+from mldb.backends import MsgPackBackend
+from mldb.backends import NumpyArchiveBackend
 from mldb.backends import NumpyBackend
 from mldb.backends import PandasBackend
 from mldb.backends import PickleBackend
@@ -1,8 +1,10 @@
 from mldb.backends.base import *
+from mldb.backends.blosc_backend import *
 from mldb.backends.filesystem_backend import *
 from mldb.backends.joblib_backend import *
 from mldb.backends.json_backend import *
 from mldb.backends.matplotlib_backend import *
+from mldb.backends.msgpack_backend import *
 from mldb.backends.numpy_backend import *
 from mldb.backends.pandas_backend import *
 from mldb.backends.pickle_backend import *
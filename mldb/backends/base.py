@@ -1,5 +1,10 @@
+from concurrent.futures import ThreadPoolExecutor
+from os import makedirs
+from os.path import dirname
 from pathlib import Path
 from typing import Any
+from typing import Dict
+from typing import Iterable
 from typing import Type
 
 from mldb.locker import FileLock
@@ -11,6 +16,12 @@ __all__ = [
 ]
 
 
+# Directories that have been created (or found to exist) by `BackendInterface.prepare`, so that each is only
+# created once per process. A directory that is removed later (eg with `rm -rf`) is created again by
+# `prepare(force=True)` when writing to it fails.
+PREPARED_DIRECTORIES = set()
+
+
 class BackendInterface(object):
     """
     This abstract class provides the main functions that need to be implemented for a backend:
@@ -53,7 +64,7 @@ class BackendInterface(object):
                 Additional arguments that may be used by child implementations.
         """
 
-        self.path = Path(path)
+        self.path = path if isinstance(path, Path) else Path(path)
 
     def exists(self) -> bool:
         """
@@ -128,6 +139,17 @@ class BackendInterface(object):
 
         raise NotImplementedError
 
+    def invalidate(self) -> None:
+        """
+        Discards anything the interface remembers about the existence of the node data, so that the next call
+        to `exists` queries the storage again. This is needed if the node data may have been removed by other
+        means than `delete` (eg by another process). The default implementation remembers nothing.
+
+        Returns
+        -------
+            None
+        """
+
     def lock(self) -> FileLock:
         """
         Returns a `FileLock` object that can be handled with Python's `with` statement.
@@ -144,16 +166,28 @@ class BackendInterface(object):
 
         return FileLock(self.path)
 
-    def prepare(self) -> None:
+    def prepare(self, force: bool = False) -> None:
         """
-        Ensures that the path exists before saving
+        Ensures that the path exists before saving. Directories are only created on the first call for each
+        directory within a process.
+
+        Parameters
+        ----------
+            force: bool (default=False)
+                If True, the directory is created even if it was prepared before, which is needed if it has
+                since been removed.
 
         Returns
         -------
         None
         """
 
-        self.path.parent.mkdir(parents=True, exist_ok=True)
+        parent = dirname(self.path)
+        if force:
+            PREPARED_DIRECTORIES.discard(parent)
+        if parent and parent not in PREPARED_DIRECTORIES:
+            makedirs(parent, exist_ok=True)
+            PREPARED_DIRECTORIES.add(parent)
 
 
 class Backend(object):
@@ -192,3 +226,75 @@ class Backend(object):
         """
 
         return self.interface(name, *args, **kwargs)
+
+    def save_many(self, items: Dict[str, Any], n_jobs: int = 1) -> None:
+        """
+        Saves several nodes at once. The default implementation saves the nodes individually, and backends
+        that are able to persist many nodes in a single operation should specialise this function.
+
+        Parameters
+        ----------
+            items: Dict[str, Any]
+                A dictionary mapping the unique name of each node to the data to be saved.
+            n_jobs: int (default=1)
+                The number of threads with which the nodes are saved. Serialisation libraries release the
+                GIL while writing to file, so several threads can overlap the I/O of independent nodes.
+
+        Returns
+        -------
+        None
+        """
+
+        def save(item):
+            name, data = item
+            self.get(name).save(data=data)
+
+        self._map(save, items.items(), n_jobs=n_jobs)
+
+    def load_many(self, names: Iterable[str], n_jobs: int = 1) -> Dict[str, Any]:
+        """
+        Loads several nodes at once. The default implementation loads the nodes individually, and backends
+        that are able to retrieve many nodes in a single operation should specialise this function.
+
+        Parameters
+        ----------
+            names: Iterable[str]
+                The unique names of the nodes to be loaded.
+            n_jobs: int (default=1)
+                The number of threads with which the nodes are loaded.
+
+        Returns
+        -------
+        Dict[str, Any]
+            A dictionary mapping each name to the loaded data.
+        """
+
+        names = list(names)
+
+        return dict(zip(names, self._map(lambda name: self.get(name).load(), names, n_jobs=n_jobs)))
+
+    def exists_many(self, names: Iterable[str]) -> Dict[str, bool]:
+        """
+        Tests the existence of several nodes at once. The default implementation queries the nodes
+        individually, and backends that can answer for many nodes in a single operation should specialise
+        this function.
+
+        Parameters
+        ----------
+            names: Iterable[str]
+                The unique names of the nodes to be tested.
+
+        Returns
+        -------
+        Dict[str, bool]
+            A dictionary mapping each name to `True` if the node data exists, and `False` otherwise.
+        """
+
+        return {name: self.get(name).exists() for name in names}
+
+    @staticmethod
+    def _map(func, iterable, n_jobs):
+        if n_jobs == 1:
+            return list(map(func, iterable))
+        with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+            return list(executor.map(func, iterable))
@@ -0,0 +1,72 @@
+import os
+
+from numpy import ndarray
+
+from mldb.backends.filesystem_backend import FileSystemBase
+from mldb.backends.filesystem_backend import FileSystemInterface
+from mldb.backends.validation import validate_dtype
+
+__all__ = [
+    "BloscInterface",
+    "BloscBackend",
+]
+
+
+def import_blosc2():
+    """Returns the `blosc2` module, which is imported on the first save or load"""
+    try:
+        import blosc2
+    except ImportError:
+        raise ImportError("The BloscBackend requires the `blosc2` package to be installed")
+    return blosc2
+
+
+class BloscInterface(FileSystemInterface):
+    def __init__(self, path, clevel=5):
+        super(BloscInterface, self).__init__(path=path)
+        self.clevel = clevel
+
+    def load(self):
+        blosc2 = import_blosc2()
+        with open(self.path, "rb") as fil:
+            data = blosc2.unpack_array2(fil.read())
+        validate_dtype(data, ndarray)
+        return data
+
+    def save(self, data):
+        blosc2 = import_blosc2()
+        validate_dtype(data, ndarray)
+        if data.dtype.hasobject:
+            raise TypeError(f"The BloscBackend cannot store arrays of Python objects (dtype={data.dtype})")
+        cparams = dict(
+            codec=blosc2.Codec.LZ4,
+            clevel=self.clevel,
+            filters=[blosc2.Filter.SHUFFLE],
+            nthreads=os.cpu_count(),
+        )
+        contents = blosc2.pack_array2(data, cparams=cparams)
+        with self.open_atomic("wb") as fil:
+            fil.write(contents)
+
+
+class BloscBackend(FileSystemBase):
+    def __init__(self, path, clevel=5):
+        """
+        Stores numeric arrays compressed with Blosc2, using the LZ4 codec after byte shuffling on all available
+        cores. For arrays whose values are correlated this is typically both smaller and faster to read back than
+        pickled or `.npy` files.
+
+        Parameters
+        ----------
+            path: str
+                The directory in which the arrays are stored.
+            clevel: int (default=5)
+                The Blosc2 compression level, between 0 (no compression) and 9.
+        """
+
+        import_blosc2()
+        super(BloscBackend, self).__init__(interface=BloscInterface, path=path, ext="b2frame")
+        self.clevel = clevel
+
+    def get(self, name, *args, **kwargs):
+        return super(BloscBackend, self).get(name, clevel=self.clevel)
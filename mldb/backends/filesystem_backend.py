@@ -1,3 +1,10 @@
+from contextlib import contextmanager
+from os import fsync
+from os import replace
+from os import scandir
+from os import unlink
+from os.path import exists
+from os.path import split
 from pathlib import Path
 
 from mldb.backends.base import Backend
@@ -9,6 +16,14 @@ __all__ = [
 ]
 
 
+# Buffer size for files that are written incrementally (eg by pickle or yaml) so that many small writes are
+# coalesced into few system calls
+IO_BUFFER_SIZE = 1 << 20
+
+# Files of at least this size are memory-mapped on load (by backends that support it) rather than read into memory
+MEMORY_MAP_THRESHOLD = 1 << 24
+
+
 class FileSystemInterface(BackendInterface):
     def __init__(self, path):
         super(FileSystemInterface, self).__init__(path=path)
@@ -16,11 +31,47 @@ class FileSystemInterface(BackendInterface):
         # Ensure that the output directory path exists
         self.prepare()
 
+        # Node data is only removed through `delete`, so once it is known to exist no further stat is needed
+        self.known_to_exist = False
+
     def exists(self):
-        return self.path.exists()
+        if not self.known_to_exist:
+            self.known_to_exist = exists(self.path)
+        return self.known_to_exist
+
+    def invalidate(self):
+        self.known_to_exist = False
 
     def delete(self):
-        return self.path.unlink()
+        self.invalidate()
+        return unlink(self.path)
+
+    @contextmanager
+    def open_atomic(self, mode="wb", buffering=-1):
+        """
+        Opens a temporary file alongside `path` for writing. When the `with` block completes, the file is
+        flushed and synced to disk once and then renamed onto `path`, so readers never observe a partially
+        written file. If the block raises, the temporary file is removed and `path` is left untouched.
+        """
+
+        temporary = f"{self.path}.tmp"
+        try:
+            fil = open(temporary, mode, buffering=buffering)
+        except FileNotFoundError:
+            # The directory was removed after it was prepared
+            self.prepare(force=True)
+            fil = open(temporary, mode, buffering=buffering)
+        try:
+            with fil:
+                yield fil
+                fil.flush()
+                fsync(fil.fileno())
+            replace(temporary, self.path)
+            self.known_to_exist = True
+        except BaseException:
+            if exists(temporary):
+                unlink(temporary)
+            raise
 
     def load(self):
         raise NotImplementedError
@@ -37,6 +88,32 @@ class FileSystemBase(Backend):
         self.path = Path(path)
         self.path.mkdir(parents=True, exist_ok=True)
 
+        self.node_paths = dict()
+
+    def node_path(self, name):
+        """Returns the path of the file that stores the node `name`, building it only on first request."""
+
+        path = self.node_paths.get(name)
+        if path is None:
+            path = self.node_paths[name] = self.path / f"{name}.{self.ext}"
+        return path
+
     def get(self, name, *args, **kwargs):
-        path = self.path / f"{name}.{self.ext}"
-        return self.interface(path, *args, **kwargs)
+        return self.interface(self.node_path(name), *args, **kwargs)
+
+    def exists_many(self, names):
+        """
+        Tests the existence of several nodes by listing each directory that holds them once, rather than
+        issuing a `stat` for every node.
+        """
+
+        locations = {name: split(self.node_path(name)) for name in names}
+        listings = dict()
+        for directory, _ in locations.values():
+            if directory not in listings:
+                try:
+                    with scandir(directory) as entries:
+                        listings[directory] = {entry.name for entry in entries}
+                except FileNotFoundError:
+                    listings[directory] = set()
+        return {name: filename in listings[directory] for name, (directory, filename) in locations.items()}
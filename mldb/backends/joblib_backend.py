@@ -1,19 +1,48 @@
+import pickle
+
 import joblib
 
 from mldb.backends.filesystem_backend import FileSystemBase
 from mldb.backends.filesystem_backend import FileSystemInterface
+from mldb.backends.filesystem_backend import IO_BUFFER_SIZE
 
 __all__ = ["JoblibBackend", "JoblibInterface"]
 
 
 class JoblibInterface(FileSystemInterface):
+    def __init__(self, path, compress=0, mmap_mode=None):
+        super(JoblibInterface, self).__init__(path=path)
+        self.compress = compress
+        self.mmap_mode = mmap_mode
+
     def load(self):
-        return joblib.load(self.path)
+        return joblib.load(self.path, mmap_mode=self.mmap_mode)
 
     def save(self, data):
-        joblib.dump(data, self.path)
+        with self.open_atomic("wb", buffering=IO_BUFFER_SIZE) as fil:
+            joblib.dump(data, fil, compress=self.compress, protocol=pickle.HIGHEST_PROTOCOL)
 
 
 class JoblibBackend(FileSystemBase):
-    def __init__(self, path, ext="joblib"):
+    def __init__(self, path, ext="joblib", compress=0, mmap_mode=None):
+        """
+        Parameters
+        ----------
+            path: str
+                The directory in which the files are stored.
+            ext: str (default="joblib")
+                The file extension.
+            compress: Union[bool, int, str, Tuple[str, int]] (default=0)
+                The compression passed to `joblib.dump`, eg `3` or `("lz4", 3)`. Compression reduces the
+                amount of data written to and read from disk at the cost of CPU time.
+            mmap_mode: Optional[str] (default=None)
+                If not `None`, the arrays in uncompressed files are memory-mapped with this mode on load (see
+                `joblib.load`).
+        """
+
         super(JoblibBackend, self).__init__(interface=JoblibInterface, path=path, ext=ext)
+        self.compress = compress
+        self.mmap_mode = mmap_mode
+
+    def get(self, name, *args, **kwargs):
+        return super(JoblibBackend, self).get(name, compress=self.compress, mmap_mode=self.mmap_mode)
@@ -1,10 +1,17 @@
 import json
-from pprint import pformat
+import mmap
+import os
 
 import numpy as np
 
 from mldb.backends.filesystem_backend import FileSystemBase
 from mldb.backends.filesystem_backend import FileSystemInterface
+from mldb.backends.filesystem_backend import MEMORY_MAP_THRESHOLD
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 __all__ = [
     "JsonInterface",
@@ -26,14 +33,43 @@ class NpEncoder(json.JSONEncoder):
             return super(NpEncoder, self).default(obj)
 
 
+def dumps_json(data, sort_keys=True, indent=None, cls=None, fast=False):
+    """
+    Serialise `data` to JSON bytes with the standard library. If `fast` is True, the C-implemented `orjson`
+    encoder is used instead when it is installed and supports the requested indentation (none, or two spaces).
+    Data that `orjson` cannot encode (eg integers wider than 64 bits) falls back to the standard library.
+    """
+    if fast and orjson is not None and indent in (None, 2):
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        default = None if cls is None else cls().default
+        try:
+            return orjson.dumps(data, default=default, option=option)
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(data, sort_keys=sort_keys, indent=indent, cls=cls).encode("utf-8")
+
+
+def loads_json(data):
+    """
+    De-serialise JSON bytes with `orjson` if it is installed, or with the standard library otherwise. Documents
+    that `orjson` rejects but the standard library accepts (eg those containing `NaN` or `Infinity`, which the
+    standard library writes for non-finite floats) are parsed again with the standard library.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data if isinstance(data, (str, bytes, bytearray)) else bytes(data))
+
+
 def prettify_json(data, json_kwargs):
-    d = pformat(json.loads(json.dumps(data, **json_kwargs)), indent=1, width=120)
-    return (
-        d.replace('"', "__double_quote__")
-        .replace("'", "__single_quote__")
-        .replace("__single_quote__", '"')
-        .replace("__double_quote__", "'")
-    )
+    """Serialise `data` to JSON bytes indented by two spaces."""
+    return dumps_json(data, **{**json_kwargs, "indent": 2})
 
 
 class JsonInterface(FileSystemInterface):
@@ -43,21 +79,48 @@ class JsonInterface(FileSystemInterface):
         self.json_kwargs = dict(kwargs)
 
     def load(self):
-        with open(self.path, "r") as fil:
-            return json.load(fil)
+        # Large files are parsed by `orjson` directly from a memory map, rather than first copied into memory
+        with open(self.path, "rb") as fil:
+            if orjson is None or os.fstat(fil.fileno()).st_size < MEMORY_MAP_THRESHOLD:
+                return loads_json(fil.read())
+            with mmap.mmap(fil.fileno(), 0, access=mmap.ACCESS_READ) as contents:
+                with memoryview(contents) as view:
+                    return loads_json(view)
 
     def save(self, data):
-        with open(self.path, "w") as fil:
-            if self.pprint:
-                fil.write(prettify_json(data, self.json_kwargs))
-            else:
-                json.dump(data, fil, **self.json_kwargs)
+        if self.pprint:
+            contents = prettify_json(data, self.json_kwargs)
+        else:
+            contents = dumps_json(data, **self.json_kwargs)
+        with self.open_atomic("wb") as fil:
+            fil.write(contents)
 
 
 class JsonBackend(FileSystemBase):
-    def __init__(self, path, sort_keys=True, indent=None, cls=None, pprint=True):
+    def __init__(self, path, sort_keys=True, indent=None, cls=None, pprint=True, fast=False):
+        """
+        Parameters
+        ----------
+            path: str
+                The directory in which the JSON files are stored.
+            sort_keys: bool (default=True)
+                Whether the keys of objects are sorted.
+            indent: Optional[int] (default=None)
+                The indentation of the JSON files, which is ignored if `pprint` is True.
+            cls: Optional[Type[json.JSONEncoder]] (default=None)
+                An encoder for types that are not natively serialisable, eg `NpEncoder`.
+            pprint: bool (default=True)
+                If True, files are indented by two spaces.
+            fast: bool (default=False)
+                If True and `orjson` is installed, files are encoded with `orjson`, which is much faster for large
+                documents and serialises numpy arrays natively. Note that `orjson` writes non-finite floats (NaN
+                and infinities) as `null`, whereas the standard library writes them as `NaN` and `Infinity`.
+                Files are decoded with `orjson` when it is installed either way.
+        """
+
         super(JsonBackend, self).__init__(path=path, ext="json", interface=JsonInterface)
-        self.json_kwargs = dict(sort_keys=sort_keys, indent=indent, cls=cls)
+        self.json_kwargs = dict(sort_keys=sort_keys, indent=indent, cls=cls, fast=fast)
+        self.pprint = pprint
 
     def get(self, name, *args, **kwargs):
-        return super(JsonBackend, self).get(name, pprint=True, **self.json_kwargs)
+        return super(JsonBackend, self).get(name, pprint=self.pprint, **self.json_kwargs)
@@ -1,5 +1,3 @@
-from matplotlib.pyplot import Figure
-
 from mldb.backends.filesystem_backend import FileSystemBase
 from mldb.backends.filesystem_backend import FileSystemInterface
 from mldb.backends.validation import validate_dtype
@@ -12,9 +10,13 @@ class MatPlotLibInterface(FileSystemInterface):
         return True
 
     def save(self, data):
+        # Deferred import; unlike `matplotlib.pyplot`, this module does not select a plotting backend
+        from matplotlib.figure import Figure
+
         fig = data
         validate_dtype(fig, Figure)
-        fig.savefig(self.path)
+        with self.open_atomic("wb") as fil:
+            fig.savefig(fil, format=self.path.suffix[1:])
         fig.clf()
 
 
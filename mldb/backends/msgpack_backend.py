@@ -0,0 +1,61 @@
+from io import BytesIO
+
+import numpy as np
+
+from mldb.backends.filesystem_backend import FileSystemBase
+from mldb.backends.filesystem_backend import FileSystemInterface
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+__all__ = [
+    "MsgPackInterface",
+    "MsgPackBackend",
+]
+
+
+# MessagePack extension code under which numpy arrays are stored (in the `.npy` format)
+NDARRAY_EXT_CODE = 1
+
+
+def encode_hook(obj):
+    """Convert numpy objects that MessagePack does not natively support."""
+    if isinstance(obj, np.generic):
+        return obj.item()
+    elif isinstance(obj, np.ndarray):
+        buffer = BytesIO()
+        np.save(buffer, obj, allow_pickle=False)
+        return msgspec.msgpack.Ext(NDARRAY_EXT_CODE, buffer.getvalue())
+    raise NotImplementedError(f"Objects of type {type(obj)} are not supported")
+
+
+def decode_ext_hook(code, data):
+    """Reconstruct the extension types produced by `encode_hook`."""
+    if code == NDARRAY_EXT_CODE:
+        return np.load(BytesIO(data), allow_pickle=False)
+    raise NotImplementedError(f"Extension type code {code} is not supported")
+
+
+if msgspec is not None:
+    ENCODER = msgspec.msgpack.Encoder(enc_hook=encode_hook)
+    DECODER = msgspec.msgpack.Decoder(ext_hook=decode_ext_hook)
+
+
+class MsgPackInterface(FileSystemInterface):
+    def load(self):
+        with open(self.path, "rb") as fil:
+            return DECODER.decode(fil.read())
+
+    def save(self, data):
+        contents = ENCODER.encode(data)
+        with self.open_atomic("wb") as fil:
+            fil.write(contents)
+
+
+class MsgPackBackend(FileSystemBase):
+    def __init__(self, path):
+        if msgspec is None:
+            raise ImportError("The MsgPackBackend requires the `msgspec` package to be installed")
+        super(MsgPackBackend, self).__init__(interface=MsgPackInterface, path=path, ext="msgpack")
@@ -1,25 +1,90 @@
 from numpy import load as np_load
 from numpy import ndarray
 from numpy import save as np_save
+from numpy import savez as np_savez
+from numpy import savez_compressed as np_savez_compressed
 
 from mldb.backends.filesystem_backend import FileSystemBase
 from mldb.backends.filesystem_backend import FileSystemInterface
 from mldb.backends.validation import validate_dtype
 
-__all__ = ["NumpyInterface", "NumpyBackend"]
+__all__ = ["NumpyInterface", "NumpyBackend", "NumpyArchiveInterface", "NumpyArchiveBackend"]
 
 
 class NumpyInterface(FileSystemInterface):
+    def __init__(self, path, mmap_mode=None, allow_pickle=False):
+        super(NumpyInterface, self).__init__(path=path)
+        self.mmap_mode = mmap_mode
+        self.allow_pickle = allow_pickle
+
     def load(self):
-        data = np_load(file=self.path, allow_pickle=True)
+        data = np_load(file=self.path, allow_pickle=self.allow_pickle, mmap_mode=self.mmap_mode)
         validate_dtype(data, ndarray)
         return data
 
     def save(self, data):
         validate_dtype(data, ndarray)
-        np_save(file=self.path, arr=data, allow_pickle=True)
+        with self.open_atomic("wb") as fil:
+            np_save(file=fil, arr=data, allow_pickle=self.allow_pickle)
 
 
 class NumpyBackend(FileSystemBase):
-    def __init__(self, path):
+    def __init__(self, path, mmap_mode=None, allow_pickle=False):
+        """
+        Parameters
+        ----------
+            path: str
+                The directory in which the arrays are stored.
+            mmap_mode: Optional[str] (default=None)
+                If not `None`, arrays are memory-mapped on load with this mode (see `numpy.load`) instead of
+                being read into memory. With `mmap_mode="r"` the loaded arrays are read-only, and with
+                `mmap_mode="c"` they may be modified without the changes being written back to file.
+            allow_pickle: bool (default=False)
+                Whether arrays of Python objects may be stored. Such arrays are pickled, so they cannot be
+                memory-mapped and are much slower to save and load than numeric arrays.
+        """
+
         super(NumpyBackend, self).__init__(interface=NumpyInterface, ext="npy", path=path)
+        self.mmap_mode = mmap_mode
+        self.allow_pickle = allow_pickle
+
+    def get(self, name, *args, **kwargs):
+        return super(NumpyBackend, self).get(name, mmap_mode=self.mmap_mode, allow_pickle=self.allow_pickle)
+
+
+class NumpyArchiveInterface(FileSystemInterface):
+    def __init__(self, path, compress=False):
+        super(NumpyArchiveInterface, self).__init__(path=path)
+        self.compress = compress
+
+    def load(self):
+        with np_load(file=self.path, allow_pickle=False) as archive:
+            return {key: archive[key] for key in archive.files}
+
+    def save(self, data):
+        validate_dtype(data, dict)
+        for value in data.values():
+            validate_dtype(value, ndarray)
+        with self.open_atomic("wb") as fil:
+            (np_savez_compressed if self.compress else np_savez)(fil, **data)
+
+
+class NumpyArchiveBackend(FileSystemBase):
+    def __init__(self, path, compress=False):
+        """
+        Stores dictionaries of arrays in `.npz` archives.
+
+        Parameters
+        ----------
+            path: str
+                The directory in which the archives are stored.
+            compress: bool (default=False)
+                Whether the archive members are compressed (see `numpy.savez_compressed`). This reduces the
+                file size at the cost of CPU time when saving and loading.
+        """
+
+        super(NumpyArchiveBackend, self).__init__(interface=NumpyArchiveInterface, ext="npz", path=path)
+        self.compress = compress
+
+    def get(self, name, *args, **kwargs):
+        return super(NumpyArchiveBackend, self).get(name, compress=self.compress)
@@ -1,28 +1,91 @@
-from pandas import DataFrame
-from pandas import read_pickle as pd_load
-from pandas import Series
-
 from mldb.backends.filesystem_backend import FileSystemBase
 from mldb.backends.filesystem_backend import FileSystemInterface
 from mldb.backends.validation import validate_dtype
 
-__all__ = ["PandasBackend", "PandasInterface"]
+__all__ = ["PandasBackend", "PandasInterface", "ParquetInterface", "FeatherInterface"]
+
 
+def pandas_dtypes():
+    """Returns the pandas types that these interfaces store. pandas is only imported when it is first needed."""
+    from pandas import DataFrame
+    from pandas import Series
 
-PANDAS_DTYPES = (Series, DataFrame)
+    return Series, DataFrame
 
 
 class PandasInterface(FileSystemInterface):
     def load(self):
-        data = pd_load(filepath_or_buffer=self.path, compression="gzip")
-        validate_dtype(data, PANDAS_DTYPES)
+        from pandas import read_pickle
+
+        data = read_pickle(filepath_or_buffer=self.path, compression="gzip")
+        validate_dtype(data, pandas_dtypes())
         return data
 
     def save(self, data):
-        validate_dtype(data, PANDAS_DTYPES)
-        data.to_pickle(path=self.path, compression="gzip")
+        validate_dtype(data, pandas_dtypes())
+        with self.open_atomic("wb") as fil:
+            data.to_pickle(fil, compression="gzip")
+
+
+class ParquetInterface(FileSystemInterface):
+    def load(self):
+        from pandas import DataFrame
+        from pandas import read_parquet
+
+        data = read_parquet(self.path, engine="pyarrow", memory_map=True)
+        validate_dtype(data, DataFrame)
+        return data
+
+    def save(self, data):
+        from pandas import DataFrame
+
+        validate_dtype(data, DataFrame)
+        with self.open_atomic("wb") as fil:
+            data.to_parquet(fil, engine="pyarrow", compression="zstd")
+
+
+class FeatherInterface(FileSystemInterface):
+    def load(self):
+        from pandas import DataFrame
+        from pandas import read_feather
+
+        data = read_feather(self.path, use_threads=True)
+        validate_dtype(data, DataFrame)
+        return data
+
+    def save(self, data):
+        from pandas import DataFrame
+
+        validate_dtype(data, DataFrame)
+        with self.open_atomic("wb") as fil:
+            data.to_feather(fil, compression="lz4")
 
 
 class PandasBackend(FileSystemBase):
-    def __init__(self, path):
-        super(PandasBackend, self).__init__(interface=PandasInterface, ext="pd", path=path)
+    def __init__(self, path, parquet=False, feather=False):
+        """
+        Parameters
+        ----------
+            path: str
+                The directory in which the data are stored.
+            parquet: bool (default=False)
+                If `True`, DataFrames are stored in the columnar Parquet format with zstd compression (this
+                requires `pyarrow`), which is typically much faster to read and write than gzip-compressed
+                pickles. Parquet files can only hold DataFrames. Otherwise Series and DataFrames are stored as
+                gzip-compressed pickles.
+            feather: bool (default=False)
+                If `True`, DataFrames are stored in the Feather (Arrow IPC) format with LZ4 compression (this also
+                requires `pyarrow`). Feather files are larger than Parquet files but are faster still to read and
+                write, which suits intermediate frames that are loaded often. Feather files can only hold
+                DataFrames. At most one of `parquet` and `feather` may be `True`.
+        """
+
+        if parquet and feather:
+            raise ValueError("At most one of `parquet` and `feather` may be True in the PandasBackend")
+
+        if feather:
+            super(PandasBackend, self).__init__(interface=FeatherInterface, ext="feather", path=path)
+        elif parquet:
+            super(PandasBackend, self).__init__(interface=ParquetInterface, ext="parquet", path=path)
+        else:
+            super(PandasBackend, self).__init__(interface=PandasInterface, ext="pd", path=path)
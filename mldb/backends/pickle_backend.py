@@ -1,7 +1,18 @@
+import mmap
+import os
 import pickle
+from io import BytesIO
+from struct import Struct
 
 from mldb.backends.filesystem_backend import FileSystemBase
 from mldb.backends.filesystem_backend import FileSystemInterface
+from mldb.backends.filesystem_backend import IO_BUFFER_SIZE
+from mldb.backends.filesystem_backend import MEMORY_MAP_THRESHOLD
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
 
 __all__ = [
     "PickleBackend",
@@ -9,16 +20,168 @@ __all__ = [
 ]
 
 
+# Files that carry out-of-band buffers (PEP 574) begin with this marker. Pickle streams written with protocol 2
+# or above begin with the PROTO opcode (b"\x80"), so the two layouts cannot be confused when loading.
+OUT_OF_BAND_MAGIC = b"MLDBOOB5"
+OUT_OF_BAND_ALIGNMENT = 64
+
+# Buffers smaller than this are kept in-band since the header and alignment overheads outweigh the saved copy
+OUT_OF_BAND_THRESHOLD = 1 << 16
+UINT64 = Struct("<Q")
+
+# Compressed files are single zstd frames, which always begin with this marker
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+
+def aligned(offset):
+    return -(-offset // OUT_OF_BAND_ALIGNMENT) * OUT_OF_BAND_ALIGNMENT
+
+
+def write_out_of_band(fil, payload, buffers):
+    """
+    Write a pickle payload and its out-of-band buffers to `fil`. The layout is the magic marker, the number of
+    buffers, the payload length, the length of each buffer, the payload, and then each buffer starting at an
+    offset aligned to `OUT_OF_BAND_ALIGNMENT` bytes.
+    """
+    header = [OUT_OF_BAND_MAGIC, UINT64.pack(len(buffers)), UINT64.pack(len(payload))]
+    header.extend(UINT64.pack(buffer.nbytes) for buffer in buffers)
+    offset = sum(map(len, header))
+    fil.write(b"".join(header))
+    for chunk in [payload, *buffers]:
+        padding = aligned(offset) - offset
+        fil.write(b"\0" * padding)
+        fil.write(chunk)
+        offset += padding + len(chunk)
+
+
+def read_out_of_band(contents):
+    """Reconstruct the object written by `write_out_of_band` without copying the out-of-band buffers."""
+    view = memoryview(contents)
+    offset = len(OUT_OF_BAND_MAGIC)
+    n_buffers, payload_size = UINT64.unpack_from(view, offset)[0], UINT64.unpack_from(view, offset + 8)[0]
+    offset += 2 * UINT64.size
+    sizes = [UINT64.unpack_from(view, offset + UINT64.size * ii)[0] for ii in range(n_buffers)]
+    offset += UINT64.size * n_buffers
+    chunks = []
+    for size in [payload_size, *sizes]:
+        offset = aligned(offset)
+        chunks.append(view[offset : offset + size])
+        offset += size
+    return pickle.loads(chunks[0], buffers=chunks[1:])
+
+
+def write_pickle(fil, payload, buffers):
+    if buffers:
+        write_out_of_band(fil, payload, [buffer.raw() for buffer in buffers])
+    else:
+        fil.write(payload)
+
+
+def decompress(fil):
+    if zstandard is None:
+        raise ImportError(f"The `zstandard` package is required to load the compressed file {fil.name}")
+    contents = BytesIO()
+    zstandard.ZstdDecompressor().copy_stream(fil, contents)
+    return contents.getbuffer()
+
+
 class PickleInterface(FileSystemInterface):
+    def __init__(self, path, memory_map=None, compression_level=None, out_of_band=False):
+        super(PickleInterface, self).__init__(path=path)
+        self.memory_map = memory_map
+        self.compression_level = compression_level
+        self.out_of_band = out_of_band
+
     def load(self):
-        with open(self.path, "rb") as fil:
-            return pickle.load(fil)
+        with open(self.path, "rb", buffering=IO_BUFFER_SIZE) as fil:
+            magic = fil.read(len(OUT_OF_BAND_MAGIC))
+            if magic.startswith(ZSTD_MAGIC):
+                fil.seek(0)
+                contents = decompress(fil)
+                if contents[: len(OUT_OF_BAND_MAGIC)] == OUT_OF_BAND_MAGIC:
+                    return read_out_of_band(contents)
+                return pickle.loads(contents)
+
+            # `pickle.load` copies every object out of its input, so standard pickles gain nothing from a memory map
+            fil.seek(0)
+            if magic != OUT_OF_BAND_MAGIC:
+                return pickle.load(fil)
+
+            # Out-of-band buffers are reconstructed as views of `contents`, so it must be writable for the loaded
+            # arrays to be writable. A copy-on-write mapping satisfies this without writing changes back to file.
+            size = os.fstat(fil.fileno()).st_size
+            memory_map = size >= MEMORY_MAP_THRESHOLD if self.memory_map is None else self.memory_map
+            if memory_map:
+                contents = mmap.mmap(fil.fileno(), 0, access=mmap.ACCESS_COPY)
+            else:
+                contents = bytearray(size)
+                fil.readinto(contents)
+        return read_out_of_band(contents)
 
     def save(self, data):
-        with open(self.path, "wb") as fil:
-            pickle.dump(data, fil)
+        with self.open_atomic("wb", buffering=IO_BUFFER_SIZE) as fil:
+            if self.compression_level is None:
+                self.dump(data, fil)
+            else:
+                compressor = zstandard.ZstdCompressor(level=self.compression_level, threads=-1)
+                with compressor.stream_writer(fil, closefd=False) as writer:
+                    self.dump(data, writer)
+
+    def dump(self, data, fil):
+        if not self.out_of_band:
+            pickle.dump(data, fil, protocol=pickle.HIGHEST_PROTOCOL)
+            return
+
+        buffers = []
+
+        def buffer_callback(buffer):
+            if memoryview(buffer).nbytes < OUT_OF_BAND_THRESHOLD:
+                return True
+            buffers.append(buffer)
+            return False
+
+        payload = pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL, buffer_callback=buffer_callback)
+        write_pickle(fil, payload, buffers)
 
 
 class PickleBackend(FileSystemBase):
-    def __init__(self, path):
-        super(PickleBackend, self).__init__(interface=PickleInterface, path=path, ext="pkl")
+    def __init__(self, path, memory_map=None, compression_level=None, out_of_band=False):
+        """
+        Parameters
+        ----------
+            path: str
+                The directory in which the pickle files are stored.
+            memory_map: Optional[bool] (default=None)
+                If `True`, files with out-of-band buffers (see `out_of_band`) are memory-mapped on load rather
+                than read into memory. Their large arrays are then paged in from file on demand, and the mapping
+                is kept alive for as long as the loaded arrays reference it. If `None`, only such files of at
+                least `MEMORY_MAP_THRESHOLD` bytes are memory-mapped, and if `False` none are. Standard pickles
+                are always read through a buffered file, since `pickle.load` copies their contents regardless.
+            compression_level: Optional[int] (default=None)
+                If not `None`, files are compressed with zstd at this level (eg 3) using all available cores,
+                which requires the `zstandard` package. Compressed files are given the extension `.pkl.zst`,
+                and are decompressed into memory rather than memory-mapped on load.
+            out_of_band: bool (default=False)
+                If `True`, buffers of at least `OUT_OF_BAND_THRESHOLD` bytes (eg large numpy arrays) are stored
+                after the pickle payload rather than within it (see `write_out_of_band`), so that they are not
+                copied when saving, and are loaded as views of the file contents. These files can only be read
+                by this backend, and are given the extension `.pkloob`. Otherwise files are standard pickles
+                that can be read with `pickle.load` or `pandas.read_pickle`.
+        """
+
+        if compression_level is not None and zstandard is None:
+            raise ImportError("Compression in the PickleBackend requires the `zstandard` package to be installed")
+
+        ext = "pkloob" if out_of_band else "pkl"
+        if compression_level is not None:
+            ext = f"{ext}.zst"
+
+        super(PickleBackend, self).__init__(interface=PickleInterface, path=path, ext=ext)
+        self.memory_map = memory_map
+        self.compression_level = compression_level
+        self.out_of_band = out_of_band
+
+    def get(self, name, *args, **kwargs):
+        return super(PickleBackend, self).get(
+            name, memory_map=self.memory_map, compression_level=self.compression_level, out_of_band=self.out_of_band
+        )
@@ -4,5 +4,5 @@ __all__ = ["ScikitLearnBackend"]
 
 
 class ScikitLearnBackend(JoblibBackend):
-    def __init__(self, path):
-        super(ScikitLearnBackend, self).__init__(ext="sklearn", path=path)
+    def __init__(self, path, compress=0, mmap_mode=None):
+        super(ScikitLearnBackend, self).__init__(ext="sklearn", path=path, compress=compress, mmap_mode=mmap_mode)
@@ -1,5 +1,3 @@
-from loguru import logger
-
 __all__ = ["validate_dtype"]
 
 
@@ -14,6 +12,5 @@ def validate_dtype(obj, dtypes):
     Raises: TypeError if obj is not
     """
     if isinstance(obj, dtypes):
-        return
-    logger.exception(f"The object {obj} is of the wrong type {type(object)} is not in {dtypes}")
-    raise TypeError
+        return True
+    raise TypeError(f"The object of type {type(obj)} is not in {dtypes}")
@@ -21,6 +21,16 @@ class VolatileInterface(BackendInterface):
         pass
 
 
+# Volatile interfaces hold no node state, so a single instance is shared by every node of every volatile backend
+VOLATILE_INTERFACE = VolatileInterface(name="volatile")
+
+
 class VolatileBackend(Backend):
     def __init__(self):
         super(VolatileBackend, self).__init__(interface=VolatileInterface, cache_data=False)
+
+    def get(self, name, *args, **kwargs):
+        return VOLATILE_INTERFACE
+
+    def exists_many(self, names):
+        return dict.fromkeys(names, False)
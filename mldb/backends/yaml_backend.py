@@ -2,6 +2,7 @@ import yaml
 
 from mldb.backends.filesystem_backend import FileSystemBase
 from mldb.backends.filesystem_backend import FileSystemInterface
+from mldb.backends.filesystem_backend import IO_BUFFER_SIZE
 
 __all__ = [
     "YamlInterface",
@@ -18,7 +19,7 @@ class YamlInterface(FileSystemInterface):
             return yaml.safe_load(fil)
 
     def save(self, data):
-        with open(self.path, "w") as fil:
+        with self.open_atomic("w", buffering=IO_BUFFER_SIZE) as fil:
             yaml.safe_dump(data, fil)
 
 
@@ -1,14 +1,25 @@
+from collections import OrderedDict
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from functools import partial
+from itertools import count
 from os import environ
 from pathlib import Path
+from sys import getsizeof
+from sys import intern
+from threading import Lock
 from typing import Any
 from typing import Callable
+from typing import Deque
 from typing import Dict
+from typing import Iterable
 from typing import List
 from typing import Optional
 from typing import Tuple
 from typing import Union
 from uuid import uuid4
+from weakref import finalize
 
 from loguru import logger
 
@@ -17,6 +28,15 @@ from mldb.backends import BackendInterface
 from mldb.backends import VolatileBackend
 from mldb.backends import VolatileInterface
 
+# Paths of nodes are shown relative to this directory in log messages
+BUILD_ROOT = environ.get("BUILD_ROOT", "/")
+
+# Nodes without a backend share this one, which is stateless
+VOLATILE_BACKEND = VolatileBackend()
+
+# Every node is given a unique integer identifier from this counter, which keys its evaluation in the cache
+NODE_IDS = count()
+
 
 class ComputationGraph(object):
     """
@@ -89,25 +109,47 @@ class ComputationGraph(object):
 
         return f"{self.__class__.__name__}({name=}, {nodes=})"
 
-    def evaluate(self, force: bool = False) -> Dict[Any, Any]:
+    def evaluate(self, force: bool = False, n_jobs: int = 1) -> Dict[Any, Any]:
         """
-        Iterate through all nodes and evaluate their values.
+        Iterate through all nodes and evaluate their values. The nodes are evaluated in a single pass of
+        `evaluate_nodes`, so each node is computed, loaded or taken from the cache at most once, however many
+        nodes depend on it.
 
         Parameters
         ----------
         force: bool (default=False)
+            If False, nodes whose values are already stored by their backends are skipped.
+        n_jobs: int (default=1)
+            The number of threads with which nodes that do not depend on one another are evaluated. See
+            `evaluate_nodes`.
+
+        Returns
+        -------
+        Dict[Any, Any]:
+            The values of the evaluated nodes, keyed as in `self.nodes`.
+        """
+
+        if force:
+            selected = dict(self.nodes)
+        else:
+            stored = nodes_exist(self.nodes.values())
+            selected = {key: node for key, node in self.nodes.items() if not stored[node]}
+        values = evaluate_nodes(list(selected.values()), n_jobs=n_jobs, stored=None if force else stored)
+        return {key: values[node] for key, node in selected.items()}
+
+    def invalidate_existence(self) -> None:
+        """
+        Discards the existence checks remembered by the backends of all nodes, so that the next evaluation
+        queries the backends again. This should be called before evaluating if stored node data may have been
+        removed by another process or by hand since it was last checked.
 
         Returns
         -------
         None
         """
 
-        evaluations = dict()
-        for key, node in self.nodes.items():
-            if node.exists and not force:
-                continue
-            evaluations[key] = node.evaluate()
-        return evaluations
+        for node in self.nodes.values():
+            node.backend_interface.invalidate()
 
     def make_node(
         self,
@@ -119,6 +161,7 @@ class ComputationGraph(object):
         key: Optional[Any] = None,
         cache: bool = True,
         collect: bool = True,
+        jit: bool = False,
     ) -> "NodeWrapper":
         """
         This function generates a new Node wrapper
@@ -142,6 +185,10 @@ class ComputationGraph(object):
             Whether to use a backend
         collect: bool (default=True)
             Whether to add the node to `self.nodes`
+        jit: bool (default=False)
+            Whether to compile `func` with `numba.njit`, which requires the `numba` package. This suits functions
+            made of numerical loops over numpy arrays and scalars. Compilation happens on the first evaluation and
+            is cached on disk, so later processes skip it.
 
         Returns
         -------
@@ -152,6 +199,15 @@ class ComputationGraph(object):
 
         assert callable(func)
 
+        # Compile the function if requested
+        if jit:
+            try:
+                # numba is optional and costly to import, so only jitted graphs import it
+                import numba
+            except ImportError:
+                raise ImportError("Compiling node functions with `jit=True` requires the `numba` package")
+            func = numba.njit(cache=True)(func)
+
         # Validate the name/key
         if name is None:
             name = str(uuid4())
@@ -197,6 +253,25 @@ def get_function_name(func: Callable) -> str:
 
 
 class NodeWrapper(object):
+    # Graphs may hold many thousands of nodes, so their attributes are stored in slots rather than a `__dict__`
+    __slots__ = (
+        "id",
+        "graph",
+        "name",
+        "func",
+        "args",
+        "kwargs",
+        "chained_nodes",
+        "dependencies",
+        "_sources",
+        "_keywords",
+        "backend",
+        "backend_interface",
+        "_name_short",
+        "_repr",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         graph: ComputationGraph,
@@ -224,6 +299,7 @@ class NodeWrapper(object):
             A Backend instance that facilitates serialisation/de-serialisation of data
         """
 
+        self.id: int = next(NODE_IDS)
         self.graph: "ComputationGraph" = graph
 
         self.name: str = name
@@ -234,21 +310,41 @@ class NodeWrapper(object):
 
         self.chained_nodes: List[NodeWrapper] = []
 
+        # The nodes on which this node depends are fixed once the node is constructed
+        self.dependencies: Tuple[NodeWrapper, ...] = tuple(dict.fromkeys(find_nodes((self.args, self.kwargs))))
+        self._sources: Dict[str, NodeWrapper] = dict()
+        self._keywords: Dict[str, Any] = dict()
+        for kk, vv in self.kwargs.items():
+            if isinstance(vv, NodeWrapper):
+                self._sources[kk] = vv
+            else:
+                self._keywords[kk] = vv
+
         if backend is None:
-            backend = VolatileBackend()
+            backend = VOLATILE_BACKEND
         assert isinstance(backend, Backend)
 
+        self.backend: Backend = backend
         self.backend_interface: BackendInterface = backend.get(name)
 
+        # Built on first use by `short_name` and `__repr__`
+        self._name_short: Optional[str] = None
+        self._repr: Optional[str] = None
+
+        # The evaluation is keyed by `id`, which no other node will share, so it is discarded with the node
+        finalize(self, discard_evaluation, self.id).atexit = False
+
     def __repr__(self) -> str:
-        """Representation of NodeWrapper object"""
+        """Representation of NodeWrapper object, which is built once since the function and arguments are fixed"""
 
-        func = get_function_name(self.func)
-        n_args = len(self.args)
-        n_kwargs = len(self.kwargs)
-        kwargs = "{" + ", ".join(f"'{kk}': ..." for kk in self.kwargs.keys()) + "}"
+        if self._repr is None:
+            func = get_function_name(self.func)
+            n_args = len(self.args)
+            n_kwargs = len(self.kwargs)
+            kwargs = "{" + ", ".join(f"'{kk}': ..." for kk in self.kwargs.keys()) + "}"
+            self._repr = f"{self.__class__.__name__}({func=}, {n_args=}, {n_kwargs=}, kwargs={kwargs})"
 
-        return f"{self.__class__.__name__}({func=}, {n_args=}, {n_kwargs=}, kwargs={kwargs})"
+        return self._repr
 
     def append_evaluation(self, node: "NodeWrapper") -> None:
         """A simple function which cascades `node` to be evaluated after `self`"""
@@ -257,6 +353,13 @@ class NodeWrapper(object):
 
         self.chained_nodes.append(node)
 
+    def short_name(self) -> str:
+        """The (interned) short name of the node for log messages, which is built once per node on first use."""
+
+        if self._name_short is None:
+            self._name_short = intern(get_short_name(self.name))
+        return self._name_short
+
     @property
     def exists(self) -> bool:
         """A wrapper around the backend object to determine if the computation of `self.func` exists already."""
@@ -267,57 +370,359 @@ class NodeWrapper(object):
     def sources(self) -> Dict[str, "NodeWrapper"]:
         """A convenience function to get the sources (i.e. the arguments for `self.func` that are `NodeWrapper`'s)."""
 
-        return {kk: vv for kk, vv in self.kwargs.items() if isinstance(vv, NodeWrapper)}
+        return self._sources
 
     @property
     def keywords(self) -> Dict[str, Any]:
         """A convenience function to get non`NodeWrapper` keyword arguments for `self.func`."""
 
-        return {kk: vv for kk, vv in self.kwargs.items() if not isinstance(vv, NodeWrapper)}
+        return self._keywords
 
-    def evaluate(self) -> Any:
+    def evaluate(self, n_jobs: int = 1) -> Any:
         """
         This function evaluates `self.func` with `self.kwargs`. If this has already been called, the cached version
         (from an LRU cache) or the serialised version (via the backend) will be returned instead. If the evaluation
         has not been done before, the evaluation will be
 
+        Parameters
+        ----------
+        n_jobs: int (default=1)
+            The number of threads with which independent dependencies are evaluated. See `evaluate_nodes`.
+
         Returns
         -------
         Any: the return value of `self.func`.
         """
 
-        out = compute_or_load_evaluation(
-            name=self.name, func=self.func, backend_interface=self.backend_interface, args=self.args, kwargs=self.kwargs
+        return evaluate_nodes([self], n_jobs=n_jobs)[self]
+
+    def compute(self, values: Optional[Dict["NodeWrapper", Any]] = None, exists: Optional[bool] = None) -> Any:
+        """
+        Computes or loads the value of this node alone. The values of the nodes on which it depends are taken from
+        `values` where available and are evaluated otherwise. Chained nodes are not evaluated. If `exists` is not
+        None, it is taken as whether the value is stored by the backend instead of testing this again.
+        """
+
+        return compute_or_load_evaluation(
+            name=self.name,
+            func=self.func,
+            backend_interface=self.backend_interface,
+            args=self.args,
+            kwargs=self.kwargs,
+            resolve=bool(self.dependencies),
+            values=values,
+            name_short=self.short_name,
+            key=self.id,
+            exists=exists,
         )
 
-        for node in self.chained_nodes:
-            node.evaluate()
 
-        return out
+def nodes_exist(nodes: Iterable[NodeWrapper]) -> Dict[NodeWrapper, bool]:
+    """
+    Tests whether the values of `nodes` are stored by their backends. Nodes that share a backend are tested together
+    with `Backend.exists_many`, so that (for example) a directory is listed once instead of each file being tested.
+    """
+
+    groups: Dict[Backend, List[NodeWrapper]] = dict()
+    for node in nodes:
+        groups.setdefault(node.backend, []).append(node)
+
+    stored = dict()
+    for backend, group in groups.items():
+        found = backend.exists_many([node.name for node in group])
+        stored.update((node, found[node.name]) for node in group)
+    return stored
+
+
+def evaluation_order(nodes: List[NodeWrapper], stored: Optional[Dict[NodeWrapper, bool]] = None) -> List[NodeWrapper]:
+    """
+    Orders `nodes` and the nodes on which they depend so that every node follows its dependencies. The graph is
+    walked with an explicit stack rather than by recursion, and the dependencies of a node are only visited if
+    its value is neither cached nor stored by its backend, since only then must the node be computed. Whether a
+    node is stored is taken from `stored` (as returned by `nodes_exist`) where available.
+    """
+
+    if stored is None:
+        stored = dict()
+
+    order = []
+    visited = set()
+    for root in nodes:
+        stack = [(root, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if expanded:
+                order.append(node)
+                continue
+            if node in visited:
+                continue
+            visited.add(node)
+            stack.append((node, True))
+            if node.id in compute_or_load_evaluation.cache:
+                continue
+            exists = stored.get(node)
+            if not (node.exists if exists is None else exists):
+                stack.extend((dependency, False) for dependency in reversed(node.dependencies))
+    return order
+
+
+def evaluation_levels(order: List[NodeWrapper]) -> List[List[NodeWrapper]]:
+    """
+    Partitions an order given by `evaluation_order` into levels. Each node is placed one level above the highest of
+    its dependencies in `order`, so that the nodes of a level do not depend on one another.
+    """
+
+    depths = dict()
+    levels = []
+    for node in order:
+        depth = 1 + max((depths[dependency] for dependency in node.dependencies if dependency in depths), default=-1)
+        depths[node] = depth
+        if depth == len(levels):
+            levels.append([])
+        levels[depth].append(node)
+    return levels
+
+
+def evaluate_nodes(
+    nodes: List[NodeWrapper], n_jobs: int = 1, stored: Optional[Dict[NodeWrapper, bool]] = None
+) -> Dict[NodeWrapper, Any]:
+    """
+    Evaluates `nodes` bottom-up in the order given by `evaluation_order`, so that each node is computed, loaded or
+    taken from the cache once and its dependencies are already available when it is computed.
+
+    Parameters
+    ----------
+    nodes: List[NodeWrapper]
+        The nodes to evaluate.
+    n_jobs: int (default=1)
+        If 1, nodes are evaluated one at a time and the nodes chained to each node are evaluated immediately after
+        it. Otherwise the nodes of each level from `evaluation_levels` are evaluated concurrently by up to `n_jobs`
+        threads (or as many as `ThreadPoolExecutor` chooses if `n_jobs` is None), and chained nodes are evaluated
+        once their level is complete. This is beneficial when the functions of the nodes release the GIL (as numpy
+        and scikit-learn mostly do) or when nodes are loaded from their backends.
+    stored: Optional[Dict[NodeWrapper, bool]] (default=None)
+        Whether the values of nodes are stored by their backends, as returned by `nodes_exist`. Nodes that are
+        not in `stored` are tested individually.
+
+    Returns
+    -------
+    Dict[NodeWrapper, Any]:
+        The values of `nodes` and of the nodes that were evaluated to compute them.
+    """
+
+    if stored is None:
+        stored = dict()
+
+    values = dict()
+    order = evaluation_order(nodes, stored=stored)
+    if n_jobs == 1:
+        for node in order:
+            values[node] = node.compute(values, exists=stored.get(node))
+            for chained in node.chained_nodes:
+                chained.evaluate()
+        return values
+
+    with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+        for level in evaluation_levels(order):
+            values.update(zip(level, executor.map(lambda node: node.compute(values, exists=stored.get(node)), level)))
+            for node in level:
+                for chained in node.chained_nodes:
+                    chained.evaluate()
+    return values
+
+
+def get_short_name(name: Any) -> str:
+    """Builds a short name for a node for printing purposes"""
+
+    if isinstance(name, Path):
+        return str(name.resolve().relative_to(BUILD_ROOT))
+    name = str(name)
+    if len(name) > 75:
+        return f"...{name[-50:]}"
+    return name
+
+
+def find_nodes(arguments: Union[Any, List[Any], Tuple[Any], Dict[str, Any]]) -> List[NodeWrapper]:
+    """A convenience function that lists the NodeWrapper objects in args and kwargs"""
+    if isinstance(arguments, NodeWrapper):
+        return [arguments]
+    if isinstance(arguments, (list, tuple)):
+        return [node for val in arguments for node in find_nodes(val)]
+    elif isinstance(arguments, dict):
+        return [node for vv in arguments.values() for node in find_nodes(vv)]
+    return []
 
 
 def resolve_arguments(
-    arguments: Union[Any, List[Any], Tuple[Any], Dict[str, Any]]
+    arguments: Union[Any, List[Any], Tuple[Any], Dict[str, Any]], values: Optional[Dict[NodeWrapper, Any]] = None
 ) -> Union[Any, List[Any], Tuple[Any], Dict[str, Any]]:
-    """A convenience function that resolves NodeWrapper objects in args and kwargs"""
+    """
+    A convenience function that resolves NodeWrapper objects in args and kwargs. Nodes whose values are already in
+    `values` are not evaluated again.
+    """
     if isinstance(arguments, NodeWrapper):
+        if values is not None and arguments in values:
+            return values[arguments]
         return arguments.evaluate()
     if isinstance(arguments, ComputationGraph):
-        logger.warning(f"Not yet evaluating ComputationalGraphs, returning object")
+        logger.warning("Not yet evaluating ComputationalGraphs, returning object")
         return arguments
     if isinstance(arguments, (list, tuple)):
-        return type(arguments)(resolve_arguments(val) for val in arguments)
+        return type(arguments)(resolve_arguments(val, values) for val in arguments)
     elif isinstance(arguments, dict):
-        return {kk: resolve_arguments(vv) for kk, vv in arguments.items()}
+        return {kk: resolve_arguments(vv, values) for kk, vv in arguments.items()}
     return arguments
 
 
+def get_size(value: Any) -> int:
+    """
+    Estimates the number of bytes held by `value`. Arrays report the size of their buffers via `nbytes`, pandas
+    objects via `memory_usage`, and other objects are measured (shallowly) with `sys.getsizeof`.
+    """
+
+    if hasattr(value, "nbytes"):
+        return int(value.nbytes)
+    if hasattr(value, "memory_usage"):
+        usage = value.memory_usage(deep=True)
+        return int(usage.sum()) if hasattr(usage, "sum") else int(usage)
+    return getsizeof(value)
+
+
+class EvaluationCache(object):
+    """
+    A least-recently-used cache of node evaluations. When more than `maxsize` evaluations, or evaluations of more
+    than `maxbytes` bytes in total, are held, the least recently used evaluations are discarded. Discarded
+    evaluations are loaded from their backend (or recomputed for volatile nodes) if they are required again. The
+    cache may be shared by the threads of `evaluate_nodes`.
+    """
+
+    def __init__(self, maxsize: Optional[int] = None, maxbytes: Optional[int] = None):
+        """
+        Parameters
+        ----------
+        maxsize: Optional[int] (default=None)
+            The maximum number of evaluations to hold. If None, the number of evaluations is unbounded.
+        maxbytes: Optional[int] (default=None)
+            The maximum total size in bytes (as estimated by `get_size`) of the evaluations to hold. An evaluation
+            that is larger than `maxbytes` by itself is not held. If None, the total size is unbounded.
+        """
+
+        self.maxsize: Optional[int] = maxsize
+        self.maxbytes: Optional[int] = maxbytes
+        self.data: "OrderedDict[Any, Any]" = OrderedDict()
+        self.sizes: Dict[Any, int] = dict()
+        self.nbytes: int = 0
+        self.lock: Lock = Lock()
+
+        # Keys whose evaluations are to be removed by the next locked operation. Finalizers of nodes append to this
+        # instead of taking `lock`, since the cyclic GC may run them while this thread already holds it.
+        self.discarded: Deque[Any] = deque()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(maxsize={self.maxsize}, maxbytes={self.maxbytes}, size={len(self)})"
+
+    def __len__(self) -> int:
+        with self.lock:
+            self.remove_discarded()
+            return len(self.data)
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self.data
+
+    def __getitem__(self, key: Any) -> Any:
+        with self.lock:
+            self.remove_discarded()
+            value = self.data[key]
+            self.data.move_to_end(key)
+            return value
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        # Sized outside the lock since `get_size` may be slow (eg for DataFrames of objects)
+        size = None if self.maxbytes is None else get_size(value)
+        with self.lock:
+            self.remove_discarded()
+            if size is not None:
+                self.nbytes -= self.sizes.pop(key, 0)
+                if size > self.maxbytes:
+                    # The evaluation cannot be held without evicting everything else, so only a stale one is removed
+                    self.data.pop(key, None)
+                    return
+                self.sizes[key] = size
+                self.nbytes += size
+            self.data[key] = value
+            self.data.move_to_end(key)
+            while self.data and self.full():
+                evicted, _ = self.data.popitem(last=False)
+                self.nbytes -= self.sizes.pop(evicted, 0)
+
+    def full(self) -> bool:
+        """Whether the cache holds more than its budget allows"""
+
+        if self.maxsize is not None and len(self.data) > self.maxsize:
+            return True
+        return self.maxbytes is not None and self.nbytes > self.maxbytes
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """Returns the evaluation cached under `key`, or `default` if there is none"""
+
+        with self.lock:
+            self.remove_discarded()
+            if key not in self.data:
+                return default
+            self.data.move_to_end(key)
+            return self.data[key]
+
+    def pop(self, key: Any, default: Any = None) -> Any:
+        """Discards the evaluation cached under `key`, and returns it (or `default` if there is none)"""
+
+        with self.lock:
+            self.remove_discarded()
+            self.nbytes -= self.sizes.pop(key, 0)
+            return self.data.pop(key, default)
+
+    def discard(self, key: Any) -> None:
+        """
+        Schedules the evaluation cached under `key` for removal by the next operation that takes the lock. This
+        does not take the lock itself, so it may be called from finalizers.
+        """
+
+        self.discarded.append(key)
+
+    def remove_discarded(self) -> None:
+        """Removes the evaluations scheduled by `discard`. This must be called with the lock held."""
+
+        while self.discarded:
+            key = self.discarded.popleft()
+            self.nbytes -= self.sizes.pop(key, 0)
+            self.data.pop(key, None)
+
+    def clear(self) -> None:
+        """Discards all cached evaluations"""
+
+        with self.lock:
+            self.discarded.clear()
+            self.data.clear()
+            self.sizes.clear()
+            self.nbytes = 0
+
+
+def discard_evaluation(key: Any) -> None:
+    """Schedules the removal of the evaluation cached under `key`, if any, from `compute_or_load_evaluation.cache`"""
+
+    compute_or_load_evaluation.cache.discard(key)
+
+
 def compute_or_load_evaluation(
     name: str,
     func: Callable,
     backend_interface: BackendInterface,
     args: Optional[Tuple[Any]],
     kwargs: Optional[Dict[str, Any]],
+    resolve: bool = True,
+    values: Optional[Dict[NodeWrapper, Any]] = None,
+    name_short: Optional[Callable[[], str]] = None,
+    key: Optional[Any] = None,
+    exists: Optional[bool] = None,
 ):
     """
     This function is the main workhorse of the library, and manages the backends, function and cache.
@@ -334,6 +739,22 @@ def compute_or_load_evaluation(
         The args for func
     kwargs: Optional[Dict[str, Any]]
         The keywords for func
+    resolve: bool (default=True)
+        Whether args and kwargs may contain NodeWrapper objects that must be evaluated before calling func. If
+        False, args and kwargs are passed to func as they are.
+    values: Optional[Dict[NodeWrapper, Any]] (default=None)
+        Values of NodeWrapper objects that have already been evaluated, which are used when resolving args and
+        kwargs instead of evaluating those nodes again.
+    name_short: Optional[Callable[[], str]] (default=None)
+        A function that returns the short name of the node for log messages. It is only called if a message is
+        emitted. If None, the short name is built from `name` each time it is required.
+    key: Optional[Any] (default=None)
+        The key under which the evaluation is cached. Nodes pass their unique integer `id`, so that nodes of
+        different graphs that share a name (and possibly not their functions or arguments) are cached separately.
+        If None, `name` is used.
+    exists: Optional[bool] (default=None)
+        Whether the value is stored by the backend, when this is already known (eg from `nodes_exist`). If None,
+        `backend_interface.exists` is called.
 
     Returns
     -------
@@ -342,62 +763,73 @@ def compute_or_load_evaluation(
 
     """
 
-    # Built a short name for printing purposes
-    if isinstance(name, Path):
-        name_short = name.resolve().relative_to(environ.get("BUILD_ROOT", "/"))
-    else:
-        name_short = name
-        if len(name_short) > 75:
-            name_short = f"...{name_short[-50:]}"
+    # The short name is only built if the log messages that use it are emitted
+    if name_short is None:
+        name_short = partial(get_short_name, name)
+
+    # If the data is cached, return it. Only evaluations that are not None are cached, and the lookup is a single
+    # operation so that another thread cannot evict the entry between testing for it and reading it.
+    if key is None:
+        key = name
+    data = compute_or_load_evaluation.cache.get(key)
+    if data is not None:
+        return data
+
+    # Volatile nodes are never stored, so they are neither tested for existence nor locked while computed
+    volatile = isinstance(backend_interface, VolatileInterface)
 
-    # If the data is cached, return it
-    if name in compute_or_load_evaluation.cache:
-        return compute_or_load_evaluation.cache[name]
+    if exists is None and not volatile:
+        exists = backend_interface.exists()
 
-    if not backend_interface.exists():
+    if volatile or not exists:
         # Set default args and kwargs
         if args is None:
             args = tuple()
         if kwargs is None:
             kwargs = dict()
 
-        with backend_interface.lock():
+        with nullcontext() if volatile else backend_interface.lock():
             # Build up dictionary of inputs
-            args = resolve_arguments(args)
-            kwargs = resolve_arguments(kwargs)
+            if resolve:
+                args = resolve_arguments(args, values)
+                kwargs = resolve_arguments(kwargs, values)
 
             # Calculate the output
-            logger.info(f"Evaluating {name_short}...")
+            logger.opt(lazy=True).info("Evaluating {}...", name_short)
             try:
                 data = func(*args, **kwargs)
             except Exception as ex:
-                logger.exception(f"The following exception was raised when computing {name}: {ex}")
-                raise ex
+                logger.exception("The following exception was raised when computing {}: {}", name, ex)
+                raise
 
             # Save data
-            if not isinstance(backend_interface, VolatileInterface):
-                logger.info(f"Serialising {name_short}...")
+            if not volatile:
+                logger.opt(lazy=True).info("Serialising {}...", name_short)
                 try:
                     backend_interface.save(data=data)
                 except Exception as ex:
-                    logger.exception(f"The following exception was raised when saving {name}: {ex}")
-                    raise ex
+                    logger.exception("The following exception was raised when saving {}: {}", name, ex)
+                    raise
 
     else:
         try:
-            logger.info(f"Deserialising {name_short}...")
+            logger.opt(lazy=True).info("Deserialising {}...", name_short)
             data = backend_interface.load()
         except Exception as ex:
-            logger.exception(f"The following exception was raised when loading {name}: {ex}")
-            raise ex
+            logger.exception("The following exception was raised when loading {}: {}", name, ex)
+            raise
 
     # Determine whether to cache these results or not
     if data is not None:
-        compute_or_load_evaluation.cache[name] = data
+        compute_or_load_evaluation.cache[key] = data
 
     return data
 
 
 if not hasattr(compute_or_load_evaluation, "cache"):
-    # TODO/FIXME: make a LRU cache with pre-defined storage capacity instead
-    compute_or_load_evaluation.cache = {}
+    # The capacity of the cache may be bounded with the `MLDB_CACHE_MAX` (number of evaluations) and
+    # `MLDB_CACHE_MAX_BYTES` (total size of evaluations) environment variables
+    compute_or_load_evaluation.cache = EvaluationCache(
+        maxsize=int(environ["MLDB_CACHE_MAX"]) if "MLDB_CACHE_MAX" in environ else None,
+        maxbytes=int(environ["MLDB_CACHE_MAX_BYTES"]) if "MLDB_CACHE_MAX_BYTES" in environ else None,
+    )
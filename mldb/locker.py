@@ -3,7 +3,11 @@
 # The modifications introduced are to simply raise a FileLockExistsException if the lock file exists
 # without attempting to re-lock and to use pathlib. Repeated attempts ought to be made by the main file.
 import fcntl
+import os
 from pathlib import Path
+from threading import Lock
+from threading import RLock
+from weakref import WeakValueDictionary
 
 __all__ = [
     "FileLockExistsException",
@@ -15,6 +19,22 @@ class FileLockExistsException(Exception):
     pass
 
 
+# In-process locks keyed by lock file name. Contention between threads of this process is resolved with these
+# before the file system is touched, and a thread that already holds a lock file may re-acquire it without any
+# system calls. `LOCK_DEPTHS` counts the nested acquisitions of each lock file by its owning thread.
+PROCESS_LOCKS = WeakValueDictionary()
+PROCESS_LOCKS_GUARD = Lock()
+LOCK_DEPTHS = dict()
+
+
+def get_process_lock(lock_filename):
+    with PROCESS_LOCKS_GUARD:
+        lock = PROCESS_LOCKS.get(lock_filename)
+        if lock is None:
+            lock = PROCESS_LOCKS[lock_filename] = RLock()
+        return lock
+
+
 class FileLock(object):
     """
     A file locking mechanism that has context-manager support so you can use it in a ``with`` statement.
@@ -30,6 +50,7 @@ class FileLock(object):
         self.is_locked = False
         self.lock_filename = Path(protected_file_path).with_suffix(".lock")
         self.lock_file = None
+        self.process_lock = None
 
     def locked(self):
         """
@@ -40,39 +61,102 @@ class FileLock(object):
 
     def available(self):
         """
-        Returns True iff the file is currently available to be locked.
+        Returns True iff the file is currently available to be locked by this thread. An existing lock file is
+        probed with a non-blocking `flock` rather than taken to be held, so a lock file that was left behind by a
+        process that died does not make the file unavailable. The lock file is never created by this check.
         """
-        return not self.lock_filename.exists()
+        process_lock = get_process_lock(self.lock_filename)
+        if not process_lock.acquire(blocking=False):
+            return False
+        try:
+            if LOCK_DEPTHS.get(self.lock_filename, 0):
+                return True
+            try:
+                fd = os.open(self.lock_filename, os.O_RDONLY)
+            except FileNotFoundError:
+                return True
+            try:
+                fcntl.flock(fd, fcntl.LOCK_SH | fcntl.LOCK_NB)
+            except OSError:
+                return False
+            finally:
+                os.close(fd)
+            return True
+        finally:
+            process_lock.release()
 
     def acquire(self, blocking=True):
         """
-        Acquire the lock, if possible. If the lock is in use, and `blocking` is False, return False.
-        Otherwise, check again every `self.delay` seconds until it either gets the lock or exceeds `timeout`
-        number of seconds, in which case it raises an exception.
+        Acquire the lock, if possible. If the lock is in use and `blocking` is False, return False. Otherwise
+        a `FileLockExistsException` is raised, since repeated attempts are left to the caller.
         """
-        # Attempt to create the lockfile.
-        # These flags cause os.open to raise an OSError if the file already exists.
-        try:
-            self.lock_file = open(self.lock_filename, "w")
-            fcntl.flock(self.lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
-        except FileNotFoundError:
-            raise FileNotFoundError
-        except IOError:
+        if self.is_locked:
+            return True
+
+        # Another thread of this process holds the lock
+        process_lock = get_process_lock(self.lock_filename)
+        if not process_lock.acquire(blocking=False):
+            if not blocking:
+                return False
             raise FileLockExistsException(f"The file {self.lock_filename} is currently in use.")
+
+        # The lockfile only needs to be created and locked if this thread does not already hold it
+        depth = LOCK_DEPTHS.get(self.lock_filename, 0)
+        if depth == 0:
+            try:
+                self.lock_file = self.open_lock_file()
+                fcntl.flock(self.lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except FileNotFoundError:
+                process_lock.release()
+                raise
+            except IOError:
+                if self.lock_file is not None:
+                    self.lock_file.close()
+                    self.lock_file = None
+                process_lock.release()
+                if not blocking:
+                    return False
+                raise FileLockExistsException(f"The file {self.lock_filename} is currently in use.")
+
+        LOCK_DEPTHS[self.lock_filename] = depth + 1
+        self.process_lock = process_lock
         self.is_locked = True
         return True
 
+    def open_lock_file(self):
+        """
+        Opens the lock file for writing. If its directory has been removed (eg by another process) since it was
+        created, it is created again.
+        """
+        try:
+            return open(self.lock_filename, "w")
+        except FileNotFoundError:
+            os.makedirs(self.lock_filename.parent, exist_ok=True)
+            return open(self.lock_filename, "w")
+
     def release(self):
         """
         Get rid of the lock by deleting the lockfile. When working in a `with` statement, this gets
         automatically called at the end.
         """
+        if not self.is_locked:
+            return
+
         self.is_locked = False
-        fcntl.flock(self.lock_file, fcntl.LOCK_UN)
-        try:
-            self.lock_filename.unlink()
-        except FileNotFoundError:
-            pass
+        depth = LOCK_DEPTHS.pop(self.lock_filename) - 1
+        if depth:
+            LOCK_DEPTHS[self.lock_filename] = depth
+        else:
+            fcntl.flock(self.lock_file, fcntl.LOCK_UN)
+            self.lock_file.close()
+            self.lock_file = None
+            try:
+                self.lock_filename.unlink()
+            except FileNotFoundError:
+                pass
+
+        self.process_lock.release()
+        self.process_lock = None
 
     def __enter__(self):
         """
@@ -101,6 +185,9 @@ class FileLock(object):
         For debug purposes only.  Removes the lock file from the hard disk.
         """
         if self.lock_filename.exists():
-            self.release()
+            if self.is_locked:
+                self.release()
+            else:
+                self.lock_filename.unlink()
             return True
         return False
@@ -24,6 +24,7 @@ setuptools.setup(
     long_description_content_type="text/markdown",
     url="https://github.com/twomeynj/mldb",
     install_requires=["joblib>=1.0", "numpy>=1.20", "pandas>=1.2", "matplotlib>=1.34", "loguru>=0.5", "pyyaml>=5.4"],
+    extras_require={"fast": ["orjson>=3.5", "msgspec>=0.18", "zstandard>=0.15", "blosc2>=2.0"], "jit": ["numba>=0.55"]},
     packages=setuptools.find_packages(),
     classifiers=[
         "Programming Language :: Python :: 3",
@@ -0,0 +1,39 @@
+import gc
+from threading import Thread
+
+from mldb import ComputationGraph
+from mldb.compgraph import compute_or_load_evaluation
+
+
+class CollectingKey(object):
+    """A cache key that runs the cyclic GC when it is hashed, ie while the cache holds its lock"""
+
+    def __hash__(self):
+        gc.collect()
+        return 0
+
+
+def test_collecting_nodes_during_cache_insert():
+    cache = compute_or_load_evaluation.cache
+
+    gc.disable()
+    try:
+        graph = ComputationGraph()
+        node = graph.make_node(func=lambda: [1, 2, 3], name="x", cache=False)
+        node.evaluate()
+        node_id = node.id
+        assert node_id in cache
+
+        # Nodes and their graphs reference each other, so they are only freed by the cyclic GC
+        del graph, node
+
+        key = CollectingKey()
+        thread = Thread(target=cache.__setitem__, args=(key, 1), daemon=True)
+        thread.start()
+        thread.join(timeout=10)
+        assert not thread.is_alive(), "Inserting into the cache deadlocked when a node was collected"
+    finally:
+        gc.enable()
+
+    assert cache.pop(key) == 1
+    assert node_id not in cache